@@ -2,6 +2,7 @@ from .cli import PokemonCLI
 from .manager import PokemonManager
 from .battle import BattleSystem
 from .pokemon import Pokemon
+from .cache import BattleCache
 
-__all__ = ['PokemonCLI', 'PokemonManager', 'BattleSystem', 'Pokemon']
+__all__ = ['PokemonCLI', 'PokemonManager', 'BattleSystem', 'Pokemon', 'BattleCache']
 __version__ = '0.2.0'
\ No newline at end of file
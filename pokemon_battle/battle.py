@@ -1,5 +1,5 @@
 import random
-from typing import Tuple, List
+from typing import Tuple, List, Dict, Optional
 from .pokemon import Pokemon
 
 class BattleSystem:
@@ -40,9 +40,11 @@ class BattleSystem:
         return int(max(1, damage))
     
     @classmethod
-    def battle(cls, pokemon1: Pokemon, pokemon2: Pokemon) -> Tuple[Pokemon, List[str]]:
+    def battle(cls, pokemon1: Pokemon, pokemon2: Pokemon,
+               stats: Optional[Dict] = None) -> Tuple[Pokemon, List[str]]:
         """
         Simula una batalla entre dos Pokémon.
+        Si se pasa `stats`, se rellena con los turnos y el daño de cada Pokémon.
         
         """
         # Preparar Pokémon para la batalla
@@ -60,12 +62,23 @@ class BattleSystem:
             f"{first.name} (Velocidad: {first.speed}) ataca primero!"
         ]
         
+        # Estadísticas opcionales de la batalla
+        if stats is None:
+            stats = {}
+        damage_dealt = {id(pokemon1): [], id(pokemon2): []}
+        stats['damage'] = {
+            'pokemon1': damage_dealt[id(pokemon1)],
+            'pokemon2': damage_dealt[id(pokemon2)]
+        }
+        
         turn = 1
         while True:
+            stats['turns'] = turn
             battle_log.append(f"\n--- Turno {turn} ---")
             
             # Primer Pokémon ataca
             damage = cls.calculate_damage(first, second)
+            damage_dealt[id(first)].append(damage)
             fainted = second.receive_damage(damage)
             battle_log.append(
                 f"{first.name} ataca a {second.name} por {damage} de daño! "
@@ -79,6 +92,7 @@ class BattleSystem:
             
             # Segundo Pokémon ataca
             damage = cls.calculate_damage(second, first)
+            damage_dealt[id(second)].append(damage)
             fainted = first.receive_damage(damage)
             battle_log.append(
                 f"{second.name} ataca a {first.name} por {damage} de daño! "
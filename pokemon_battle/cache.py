@@ -0,0 +1,202 @@
+"""
+Módulo con la caché de resultados de batallas.
+Guarda resúmenes de enfrentamientos simulados para no repetir las batallas.
+"""
+
+import json
+import os
+import random
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from .battle import BattleSystem
+from .pokemon import Pokemon
+
+
+class BattleCache:
+    """Caché LRU de resúmenes de batallas entre pares de Pokémon."""
+
+    def __init__(self, max_entries: int = 256, cache_path: str = None):
+        """
+        Inicializa la caché, cargando las entradas guardadas si existe el archivo.
+
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries debe ser al menos 1")
+
+        self.max_entries = max_entries
+        self.cache_path = cache_path
+        self._entries: "OrderedDict[Tuple, Dict]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+        if cache_path and os.path.exists(cache_path):
+            self.load()
+
+    @staticmethod
+    def _make_key(attacker: Pokemon, defender: Pokemon, trials: int, seed: Optional[int]) -> Tuple:
+        """Construye la clave de una entrada a partir de los participantes."""
+        return (attacker.name.lower(), defender.name.lower(), trials, seed)
+
+    @staticmethod
+    def _fingerprint(pokemon: Pokemon) -> list:
+        """
+        Obtiene los datos de combate de un Pokémon.
+        Permite descartar entradas obsoletas si el catálogo cambió fuera de la caché.
+
+        """
+        stats = [pokemon.hp, pokemon.attack, pokemon.defense,
+                 pokemon.sp_attack, pokemon.sp_defense, pokemon.speed]
+        return [
+            str(pokemon.type1),
+            [int(stat) for stat in stats],
+            [[t, float(v)] for t, v in sorted(pokemon.against_types.items())]
+        ]
+
+    def get_summary(self, attacker: Pokemon, defender: Pokemon,
+                    trials: int = 100, seed: Optional[int] = 0) -> Dict:
+        """
+        Obtiene el resumen de un enfrentamiento, simulándolo si no está en caché.
+
+        """
+        key = self._make_key(attacker, defender, trials, seed)
+        fingerprint = [self._fingerprint(attacker), self._fingerprint(defender)]
+
+        entry = self._entries.get(key)
+        if entry is not None and entry['fingerprint'] == fingerprint:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry['summary']
+
+        self.misses += 1
+        summary = self._simulate(attacker, defender, trials, seed)
+        self._entries[key] = {'fingerprint': fingerprint, 'summary': summary}
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+        return summary
+
+    @staticmethod
+    def _simulate(attacker: Pokemon, defender: Pokemon, trials: int, seed: Optional[int]) -> Dict:
+        """Simula varias batallas y resume los resultados."""
+        if trials < 1:
+            raise ValueError("trials debe ser al menos 1")
+
+        # Semilla local para no alterar el estado aleatorio global
+        state = random.getstate()
+        if seed is not None:
+            random.seed(seed)
+
+        try:
+            wins = 0
+            total_turns = 0
+            damage_distribution: Dict[int, int] = {}
+
+            for _ in range(trials):
+                stats = {}
+                winner, _ = BattleSystem.battle(attacker, defender, stats=stats)
+                if winner is attacker:
+                    wins += 1
+                total_turns += stats['turns']
+                for damage in stats['damage']['pokemon1']:
+                    damage_distribution[damage] = damage_distribution.get(damage, 0) + 1
+        finally:
+            if seed is not None:
+                random.setstate(state)
+            attacker.reset_hp()
+            defender.reset_hp()
+
+        return {
+            'trials': trials,
+            'win_rate': wins / trials,
+            'mean_turns': total_turns / trials,
+            'damage_distribution': dict(sorted(damage_distribution.items()))
+        }
+
+    def invalidate(self, name: str) -> int:
+        """
+        Elimina las entradas en las que participa un Pokémon.
+
+        """
+        name = name.lower()
+        stale = [key for key in self._entries if name in (key[0], key[1])]
+        for key in stale:
+            del self._entries[key]
+
+        self.invalidations += len(stale)
+        return len(stale)
+
+    def clear(self) -> None:
+        """Vacía la caché sin reiniciar las estadísticas."""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        """Devuelve las estadísticas de uso de la caché."""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations,
+            'size': len(self._entries),
+            'max_entries': self.max_entries
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def save(self, cache_path: str = None) -> None:
+        """Guarda las entradas de la caché en un archivo JSON."""
+        cache_path = cache_path or self.cache_path
+        if not cache_path:
+            return
+
+        entries = [
+            {
+                'key': list(key),
+                'fingerprint': entry['fingerprint'],
+                'summary': {
+                    **entry['summary'],
+                    'damage_distribution': [
+                        [damage, count] for damage, count in entry['summary']['damage_distribution'].items()
+                    ]
+                }
+            }
+            for key, entry in self._entries.items()
+        ]
+
+        try:
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                json.dump(entries, f)
+        except OSError as e:
+            print(f"Error al guardar la caché de batallas: {str(e)}")
+
+    def load(self, cache_path: str = None) -> None:
+        """Carga las entradas de la caché desde un archivo JSON."""
+        cache_path = cache_path or self.cache_path
+        if not cache_path:
+            return
+
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+
+            self._entries.clear()
+            for item in entries[-self.max_entries:]:
+                summary = dict(item['summary'])
+                summary['damage_distribution'] = {
+                    int(damage): count for damage, count in summary['damage_distribution']
+                }
+                self._entries[tuple(item['key'])] = {
+                    'fingerprint': item['fingerprint'],
+                    'summary': summary
+                }
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            # Una caché corrupta no debe impedir el uso del sistema
+            print(f"Error al cargar la caché de batallas: {str(e)}")
+            self._entries.clear()
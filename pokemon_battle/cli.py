@@ -1,15 +1,22 @@
+import os
 from typing import Optional
 from .manager import PokemonManager
 from .battle import BattleSystem
+from .cache import BattleCache
 from .pokemon import Pokemon
 
 ##Módulo de interfaz de línea de comandos para el sistema de batallas Pokémon.
 class PokemonCLI:
     """Clase que maneja la interfaz de usuario por línea de comandos."""
     
+    SIMULATION_TRIALS = 100
+    
     def __init__(self):
-        """Inicializa el CLI con un PokemonManager."""
-        self.manager = PokemonManager()
+        """Inicializa el CLI con un PokemonManager y la caché de batallas."""
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+        cache_path = os.path.join(base_dir, 'data', 'battle_cache.json')
+        self.battle_cache = BattleCache(cache_path=cache_path)
+        self.manager = PokemonManager(battle_cache=self.battle_cache)
     
     def start(self) -> None:
         """Inicia la interfaz de usuario."""
@@ -33,6 +40,7 @@ class PokemonCLI:
             elif choice == '6':
                 self._battle_pokemons()
             elif choice == '7':
+                self.battle_cache.save()
                 print("\n¡Gracias por usar el Sistema de Batallas Pokémon!")
                 break
             else:
@@ -269,6 +277,18 @@ class PokemonCLI:
             print(line)
         
         print(f"\n¡El ganador es {winner.name} (#{winner.pokedex_number})!")
+        
+        # Resumen de simulaciones (reutiliza la caché si ya se calculó)
+        summary = self.battle_cache.get_summary(pokemon1, pokemon2, trials=self.SIMULATION_TRIALS)
+        cache_stats = self.battle_cache.stats()
+        print(f"\n--- Estadísticas ({summary['trials']} simulaciones) ---")
+        print(f"Victorias de {pokemon1.name}: {summary['win_rate']:.0%}")
+        print(f"Turnos promedio: {summary['mean_turns']:.1f}")
+        damages = summary['damage_distribution']
+        if damages:
+            print(f"Daño de {pokemon1.name}: {min(damages)}-{max(damages)}")
+        print(f"Caché: {cache_stats['hits']} aciertos, {cache_stats['misses']} fallos")
+        
         input("\nPresione Enter para continuar...")
 
 
@@ -2,12 +2,14 @@ import pandas as pd
 import os
 from typing import Dict, Optional, List
 from .pokemon import Pokemon
+from .cache import BattleCache
 
 class PokemonManager:
     """Clase que gestiona la colección de Pokémon y carga los datos del CSV."""
     
-    def __init__(self, csv_path=None):
+    def __init__(self, csv_path=None, battle_cache: Optional[BattleCache] = None):
         self.pokemons: Dict[str, Pokemon] = {}  # Inicialización explícita
+        self.battle_cache = battle_cache
         # Obtiene la ruta absoluta al archivo CSV
         if csv_path is None:
             base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -145,12 +147,18 @@ class PokemonManager:
             print(f"Error al guardar el CSV: {str(e)}")
             raise
         
+    def _invalidate_battles(self, name: str) -> None:
+        """Descarta los resultados en caché en los que participa un Pokémon."""
+        if self.battle_cache is not None:
+            self.battle_cache.invalidate(name)
+        
     def add_pokemon(self, pokemon: Pokemon) -> bool:
         """Agrega nuevo Pokémon y guarda en CSV"""
         if pokemon.name.lower() in self.pokemons:
             return False
             
         self.pokemons[pokemon.name.lower()] = pokemon
+        self._invalidate_battles(pokemon.name)
         self._save_to_csv()  # Guarda los cambios
         return True
 
@@ -164,6 +172,7 @@ class PokemonManager:
             if hasattr(pokemon, attr):
                 setattr(pokemon, attr, value)
         
+        self._invalidate_battles(pokemon.name)
         self._save_to_csv()  # Guarda los cambios
         return True
 
@@ -173,6 +182,7 @@ class PokemonManager:
             return False
             
         del self.pokemons[name.lower()]
+        self._invalidate_battles(name)
         self._save_to_csv()  # Guarda los cambios
         return True
         